@@ -1,20 +1,50 @@
-from fastapi import FastAPI, HTTPException, Query, Path
-from fastapi.responses import Response
+from fastapi import FastAPI, HTTPException, Header, Query, Path
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, validator
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import Callable, Optional, Dict, List, Set
+from dataclasses import dataclass, field
 import hashlib
+import json
 import re
+import threading
+import time
+from bisect import bisect_left
 from collections import Counter
+from itertools import count
+from sortedcontainers import SortedList
+import numpy as np
+import orjson
 
 app = FastAPI(
     title="String Analysis API",
     description="RESTful API service that analyzes strings and stores their computed properties",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # In-memory storage
-strings_db: Dict[str, dict] = {}
+strings_db: Dict[bytes, "StoredRecord"] = {}  # keyed on raw 32-byte SHA-256 digest
+
+# Persistent snapshot of strings_db.values(), in insertion order, so unfiltered
+# reads do not materialize a new list. Each digest gets an increasing insert
+# sequence number; _values_seq runs parallel to _values_list so a delete can
+# bisect to its slot.
+_values_list: List["StoredRecord"] = []
+_values_seq: List[int] = []
+_insert_seq: Dict[bytes, int] = {}
+_seq_counter = count()
+
+# Secondary indices over strings_db, maintained on insert/delete so that
+# filtering does not have to scan every stored string
+_by_palindrome: Set[bytes] = set()
+_by_word_count: Dict[int, Set[bytes]] = {}
+_by_length = SortedList()  # (length, digest) pairs
+_by_char: Dict[str, Set[bytes]] = {}  # lowercase character -> digests
+
+# Serialized GET /strings bodies keyed by filters; _invalidate_responses()
+# clears it whenever the stored strings change
+_response_cache: Dict[tuple, tuple] = {}  # key -> (etag, body)
+_RESPONSE_CACHE_SIZE = 256
 
 # Request/Response Models
 class StringInput(BaseModel):
@@ -50,47 +80,274 @@ class NaturalLanguageResponse(BaseModel):
     count: int
     interpreted_query: Dict
 
+# Storage Records (the pydantic models above only describe the API schema)
+@dataclass(slots=True, frozen=True)
+class StoredProperties:
+    length: int
+    is_palindrome: bool
+    unique_characters: int
+    word_count: int
+    sha256_hash: str
+    character_frequency_map: Dict[str, int]
+    
+    def to_response_dict(self) -> dict:
+        """Plain dict in the StringProperties shape"""
+        return {
+            "length": self.length,
+            "is_palindrome": self.is_palindrome,
+            "unique_characters": self.unique_characters,
+            "word_count": self.word_count,
+            "sha256_hash": self.sha256_hash,
+            "character_frequency_map": self.character_frequency_map
+        }
+
+@dataclass(slots=True, frozen=True)
+class StoredRecord:
+    id: str
+    value: str
+    properties: StoredProperties
+    created_at: str
+    char_set: frozenset = field(repr=False, compare=False)  # lowercase characters
+    char_mask: int = field(repr=False, compare=False)  # bitmap, see _CHAR_BITS
+    body: bytes = field(init=False, repr=False, compare=False)  # serialized response
+    
+    def __post_init__(self):
+        # Records are immutable once stored, so serialize the response once
+        object.__setattr__(self, "body", orjson.dumps(self.to_response_dict()))
+    
+    def to_response_dict(self) -> dict:
+        """Plain dict in the StringResponse shape"""
+        return {
+            "id": self.id,
+            "value": self.value,
+            "properties": self.properties.to_response_dict(),
+            "created_at": self.created_at
+        }
+
+# hashlib.sha256 is backed by OpenSSL, which already dispatches to SHA-NI/AVX2
+# compression routines on CPUs that support them; bind it once for hot paths.
+_sha256 = hashlib.sha256
+
 # Helper Functions
-def compute_sha256(text: str) -> str:
-    """Compute SHA-256 hash of the string"""
-    return hashlib.sha256(text.encode()).hexdigest()
+def _hash_bytes(text: str) -> bytes:
+    """Compute the raw SHA-256 digest of the string"""
+    return _sha256(text.encode()).digest()
+
+def _sha256_many(values: List[bytes]) -> List[bytes]:
+    """Compute raw SHA-256 digests for a batch of byte strings"""
+    sha256 = _sha256
+    return [sha256(v).digest() for v in values]
+
+# Lowercases ASCII letters and drops spaces in a single translate pass
+_PAL_TABLE = str.maketrans({**{c: c + 32 for c in range(65, 91)}, ord(" "): None})
 
 def is_palindrome(text: str) -> bool:
     """Check if string is a palindrome (case-insensitive)"""
-    cleaned = text.lower().replace(" ", "")
-    return cleaned == cleaned[::-1]
+    if text.isascii():
+        cleaned = text.translate(_PAL_TABLE)
+    else:
+        cleaned = text.lower().replace(" ", "")
+    half = len(cleaned) // 2
+    return cleaned[:half] == cleaned[:-half - 1:-1]
 
-def count_unique_characters(text: str) -> int:
-    """Count distinct characters in the string"""
-    return len(set(text))
+_WS_RE = re.compile(r'\S+')
 
 def count_words(text: str) -> int:
     """Count words separated by whitespace"""
-    return len(text.split())
+    return sum(1 for _ in _WS_RE.finditer(text))
+
+# Below this length Counter's C loop beats the numpy call overhead
+_BINCOUNT_MIN_LENGTH = 512
 
 def get_character_frequency(text: str) -> Dict[str, int]:
     """Get character frequency map"""
-    return dict(Counter(text))
-
-def analyze_string(value: str) -> dict:
-    """Analyze string and compute all properties"""
-    sha256_hash = compute_sha256(value)
-    
-    properties = {
-        "length": len(value),
-        "is_palindrome": is_palindrome(value),
-        "unique_characters": count_unique_characters(value),
-        "word_count": count_words(value),
-        "sha256_hash": sha256_hash,
-        "character_frequency_map": get_character_frequency(value)
-    }
-    
-    return {
-        "id": sha256_hash,
-        "value": value,
-        "properties": properties,
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    }
+    if len(text) < _BINCOUNT_MIN_LENGTH or not text.isascii():
+        return dict(Counter(text))
+    
+    # Dense 128-slot histogram over the ASCII bytes
+    counts = np.bincount(np.frombuffer(text.encode("ascii"), dtype=np.uint8), minlength=128)
+    return _histogram_to_map(text, counts)
+
+def _histogram_to_map(text: str, counts: np.ndarray) -> Dict[str, int]:
+    """Convert an ASCII histogram into a frequency map in first-occurrence order"""
+    present = np.flatnonzero(counts).tolist()
+    # Keep first-occurrence key order, matching Counter
+    present.sort(key=lambda code: text.find(chr(code)))
+    return {chr(code): int(counts[code]) for code in present}
+
+# Per-thread (epoch second, "YYYY-MM-DDTHH:MM:SS.") so the date/time part is
+# only formatted once per second
+_ts_cache = threading.local()
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601 format with microseconds and a Z suffix"""
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if getattr(_ts_cache, "second", None) != second:
+        _ts_cache.prefix = "%04d-%02d-%02dT%02d:%02d:%02d." % time.gmtime(second)[:6]
+        _ts_cache.second = second
+    return f"{_ts_cache.prefix}{nanos // 1000:06d}Z"
+
+# Bit positions for the per-record character bitmap: a-z -> 0..25, 0-9 -> 26..35
+_CHAR_BITS = {
+    char: 1 << bit
+    for bit, char in enumerate("abcdefghijklmnopqrstuvwxyz0123456789")
+}
+
+def _char_mask(chars: frozenset) -> int:
+    """Fold the a-z/0-9 members of a character set into a bitmap"""
+    mask = 0
+    for char in chars:
+        mask |= _CHAR_BITS.get(char, 0)
+    return mask
+
+def _build_record(value: str, digest: bytes, freq: Dict[str, int], created_at: str) -> StoredRecord:
+    """Assemble a stored record from precomputed hash and frequency map"""
+    sha256_hash = digest.hex()
+    
+    properties = StoredProperties(
+        length=len(value),
+        is_palindrome=is_palindrome(value),
+        unique_characters=len(freq),
+        word_count=count_words(value),
+        sha256_hash=sha256_hash,
+        character_frequency_map=freq
+    )
+    
+    char_set = frozenset(value.lower())
+    
+    return StoredRecord(
+        id=sha256_hash,
+        value=value,
+        properties=properties,
+        created_at=created_at,
+        char_set=char_set,
+        char_mask=_char_mask(char_set)
+    )
+
+def analyze_string(value: str, digest: Optional[bytes] = None) -> StoredRecord:
+    """Analyze string and compute all properties, reusing a precomputed digest if given"""
+    if digest is None:
+        digest = _hash_bytes(value)
+    freq = get_character_frequency(value)
+    return _build_record(value, digest, freq, _utc_timestamp())
+
+def _bulk_analyze(values: List[str]) -> List[StoredRecord]:
+    """Analyze many strings at once (e.g. when restoring a snapshot)"""
+    created_at = _utc_timestamp()
+    digests = _sha256_many([value.encode() for value in values])
+    freqs: List[Optional[Dict[str, int]]] = [None] * len(values)
+    
+    # Count (row, byte) pairs for all ASCII values in one vectorized pass
+    rows = [i for i, value in enumerate(values) if value.isascii()]
+    if rows:
+        data = np.frombuffer("".join(values[i] for i in rows).encode("ascii"), dtype=np.uint8)
+        lengths = np.fromiter((len(values[i]) for i in rows), dtype=np.intp, count=len(rows))
+        keys = np.repeat(np.arange(len(rows), dtype=np.intp), lengths) * 128 + data
+        pairs, first, counts = np.unique(keys, return_index=True, return_counts=True)
+        # Ordering by first position keeps rows contiguous and Counter's key order
+        order = np.argsort(first, kind="stable")
+        pairs = pairs[order]
+        counts = counts[order].tolist()
+        chars = [chr(code) for code in (pairs % 128).tolist()]
+        bounds = np.searchsorted(pairs // 128, np.arange(len(rows) + 1)).tolist()
+        for row, i in enumerate(rows):
+            start, stop = bounds[row], bounds[row + 1]
+            freqs[i] = dict(zip(chars[start:stop], counts[start:stop]))
+    
+    return [
+        _build_record(value, digest, freq if freq is not None else dict(Counter(value)), created_at)
+        for value, digest, freq in zip(values, digests, freqs)
+    ]
+
+def _index_add(digest: bytes, record: StoredRecord) -> None:
+    """Register a stored string in the secondary indices"""
+    seq = _insert_seq[digest] = next(_seq_counter)
+    _values_seq.append(seq)
+    _values_list.append(record)
+    props = record.properties
+    if props.is_palindrome:
+        _by_palindrome.add(digest)
+    _by_word_count.setdefault(props.word_count, set()).add(digest)
+    _by_length.add((props.length, digest))
+    for char in record.char_set:
+        _by_char.setdefault(char, set()).add(digest)
+
+def _index_remove(digest: bytes, record: StoredRecord) -> None:
+    """Remove a stored string from the secondary indices"""
+    pos = bisect_left(_values_seq, _insert_seq.pop(digest))
+    del _values_seq[pos]
+    del _values_list[pos]
+    props = record.properties
+    _by_palindrome.discard(digest)
+    bucket = _by_word_count[props.word_count]
+    bucket.discard(digest)
+    if not bucket:
+        del _by_word_count[props.word_count]
+    _by_length.remove((props.length, digest))
+    for char in record.char_set:
+        bucket = _by_char[char]
+        bucket.discard(digest)
+        if not bucket:
+            del _by_char[char]
+
+def _invalidate_responses() -> None:
+    """Drop cached list responses after the stored strings change"""
+    _response_cache.clear()
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def clear_strings() -> None:
+    """Remove all stored strings and reset the indices"""
+    strings_db.clear()
+    _values_list.clear()
+    _values_seq.clear()
+    _insert_seq.clear()
+    _by_palindrome.clear()
+    _by_word_count.clear()
+    _by_length.clear()
+    _by_char.clear()
+    _invalidate_responses()
+
+# Natural language queries are matched with plain str.find scans; the grammar
+# is a handful of fixed phrases, so no regex engine is needed
+
+def _number_after(query: str, phrase: str) -> Optional[int]:
+    """Return the integer directly following the first "<phrase><digits>" match"""
+    pos = query.find(phrase)
+    while pos != -1:
+        start = end = pos + len(phrase)
+        while end < len(query) and query[end].isdecimal():
+            end += 1
+        if end > start:
+            return int(query[start:end])
+        pos = query.find(phrase, pos + 1)
+    return None
+
+def _contained_letter(query: str) -> Optional[str]:
+    """Return X from the first "contain(s|ing) [the ]letter X" phrase"""
+    pos = query.find("letter ")
+    while pos != -1:
+        char = query[pos + 7:pos + 8]
+        if "a" <= char <= "z":
+            head = query[:pos]
+            if head.endswith("the "):
+                head = head[:-4]
+            if head.endswith(("contain ", "contains ", "containing ")):
+                return char
+        pos = query.find("letter ", pos + 1)
+    return None
 
 def parse_natural_language_query(query: str) -> Dict:
     """Parse natural language query into filter parameters"""
@@ -110,22 +367,22 @@ def parse_natural_language_query(query: str) -> Dict:
         filters["word_count"] = 3
     
     # Parse length requirements
-    length_match = re.search(r'longer than (\d+)', query_lower)
-    if length_match:
-        filters["min_length"] = int(length_match.group(1)) + 1
+    number = _number_after(query_lower, "longer than ")
+    if number is not None:
+        filters["min_length"] = number + 1
     
-    length_match = re.search(r'shorter than (\d+)', query_lower)
-    if length_match:
-        filters["max_length"] = int(length_match.group(1)) - 1
+    number = _number_after(query_lower, "shorter than ")
+    if number is not None:
+        filters["max_length"] = number - 1
     
-    length_match = re.search(r'at least (\d+)', query_lower)
-    if length_match:
-        filters["min_length"] = int(length_match.group(1))
+    number = _number_after(query_lower, "at least ")
+    if number is not None:
+        filters["min_length"] = number
     
     # Parse character contains
-    char_match = re.search(r'contain(?:ing|s)? (?:the )?letter ([a-z])', query_lower)
-    if char_match:
-        filters["contains_character"] = char_match.group(1)
+    char = _contained_letter(query_lower)
+    if char is not None:
+        filters["contains_character"] = char
     
     # Parse "first vowel" as 'a'
     if "first vowel" in query_lower:
@@ -133,27 +390,97 @@ def parse_natural_language_query(query: str) -> Dict:
     
     return filters
 
-def apply_filters(strings_list: List[dict], filters: Dict) -> List[dict]:
-    """Apply filters to list of strings"""
-    filtered = strings_list
-    
-    if "is_palindrome" in filters:
-        filtered = [s for s in filtered if s["properties"]["is_palindrome"] == filters["is_palindrome"]]
+# Per-record filter checks, in the order they are evaluated (cheapest and most
+# selective first). Only these constant snippets are compiled; filter values
+# are read from the bound dict at call time, never interpolated into source.
+_PREDICATE_CLAUSES = {
+    "is_palindrome": 's.properties.is_palindrome == f["is_palindrome"]',
+    "word_count": 's.properties.word_count == f["word_count"]',
+    "contains_mask": 's.char_mask & f["contains_mask"]',
+    "contains_character": 'f["contains_character"] in s.char_set',
+    "contains_substring": 'f["contains_character"] in s.value.lower()',
+    "min_length": 's.properties.length >= f["min_length"]',
+    "max_length": 's.properties.length <= f["max_length"]',
+}
+_pred_cache: Dict[frozenset, Callable[[Dict], Callable[[StoredRecord], bool]]] = {}
+
+def _compile_predicate(keys: frozenset) -> Callable[[Dict], Callable[[StoredRecord], bool]]:
+    """Build (once per combination of filter keys) a fused predicate factory"""
+    factory = _pred_cache.get(keys)
+    if factory is None:
+        body = " and ".join(
+            clause for key, clause in _PREDICATE_CLAUSES.items() if key in keys
+        )
+        code = compile(f"lambda f: lambda s: {body}", "<filter predicate>", "eval")
+        factory = _pred_cache[keys] = eval(code)
+    return factory
+
+def apply_filters(filters: Dict) -> List[StoredRecord]:
+    """Apply filters, seeding candidates from the most selective index"""
+    if not filters:
+        # Shared snapshot; callers only read it
+        return _values_list
     
-    if "min_length" in filters:
-        filtered = [s for s in filtered if s["properties"]["length"] >= filters["min_length"]]
+    # Candidate sources as (size, filter keys they satisfy, digests)
+    sources = []
     
-    if "max_length" in filters:
-        filtered = [s for s in filtered if s["properties"]["length"] <= filters["max_length"]]
+    if filters.get("is_palindrome"):
+        sources.append((len(_by_palindrome), ("is_palindrome",), _by_palindrome))
     
     if "word_count" in filters:
-        filtered = [s for s in filtered if s["properties"]["word_count"] == filters["word_count"]]
+        bucket = _by_word_count.get(filters["word_count"], ())
+        sources.append((len(bucket), ("word_count",), bucket))
+    
+    # Lowercasing can expand one character into several (e.g. "İ"), which
+    # the single-character index cannot answer
+    if "contains_character" in filters and len(filters["contains_character"]) == 1:
+        bucket = _by_char.get(filters["contains_character"], ())
+        sources.append((len(bucket), ("contains_character",), bucket))
+    
+    if "min_length" in filters or "max_length" in filters:
+        start = 0
+        stop = len(_by_length)
+        if "min_length" in filters:
+            start = _by_length.bisect_left((filters["min_length"],))
+        if "max_length" in filters:
+            stop = _by_length.bisect_left((filters["max_length"] + 1,))
+        digests = (digest for _, digest in _by_length.islice(start, stop))
+        sources.append((max(stop - start, 0), ("min_length", "max_length"), digests))
     
-    if "contains_character" in filters:
-        char = filters["contains_character"]
-        filtered = [s for s in filtered if char in s["value"].lower()]
+    # Which source seeds the scan depends on current bucket sizes, so every
+    # path must yield rows in insertion order (the seed is sorted below and
+    # _values_list is kept ordered)
+    if sources:
+        _, covered, digests = min(sources, key=lambda source: source[0])
+        # Index buckets are unordered; return rows in insertion order
+        digests = sorted(digests, key=_insert_seq.__getitem__)
+        candidates = (strings_db[digest] for digest in digests)
+    else:
+        covered = ()
+        candidates = _values_list
     
-    return filtered
+    # Check the remaining predicates in one pass
+    remaining = frozenset(filters).difference(covered)
+    if not remaining:
+        return list(candidates)
+    
+    # Letters and digits are tested against the bitmap instead of the set
+    char_bit = _CHAR_BITS.get(filters.get("contains_character"))
+    if "contains_character" in remaining and char_bit is not None:
+        remaining = remaining.difference(("contains_character",)).union(("contains_mask",))
+        filters = {**filters, "contains_mask": char_bit}
+    elif "contains_character" in remaining and len(filters["contains_character"]) != 1:
+        remaining = remaining.difference(("contains_character",)).union(("contains_substring",))
+    
+    return list(filter(_compile_predicate(remaining)(filters), candidates))
+
+def _dumps(content: dict) -> bytes:
+    """Serialize a response body with orjson, falling back to json for big ints"""
+    try:
+        return orjson.dumps(content)
+    except orjson.JSONEncodeError:
+        # orjson only handles 64-bit integers; query filters are unbounded
+        return json.dumps(content, separators=(",", ":")).encode()
 
 # API Endpoints 
 
@@ -163,17 +490,24 @@ async def create_string(string_input: StringInput):
     value = string_input.value
     
     # Check if string already exists
-    sha256_hash = compute_sha256(value)
-    if sha256_hash in strings_db:
+    digest = _hash_bytes(value)
+    if digest in strings_db:
         raise HTTPException(status_code=409, detail="String already exists in the system")
     
     # Analyze and store string
-    result = analyze_string(value)
-    strings_db[sha256_hash] = result
+    result = analyze_string(value, digest)
+    strings_db[digest] = result
+    _index_add(digest, result)
+    _invalidate_responses()
     
-    return result
+    return Response(content=result.body, status_code=201, media_type="application/json")
 
-@app.get("/strings/filter-by-natural-language", response_model=NaturalLanguageResponse)
+# List endpoints serialize plain dicts with orjson instead of re-validating
+# every record through pydantic; the models are kept for the OpenAPI schema
+@app.get(
+    "/strings/filter-by-natural-language",
+    responses={200: {"model": NaturalLanguageResponse}}
+)
 async def filter_by_natural_language(query: str = Query(..., min_length=1)):
     """Filter strings using natural language queries - MUST be before /strings/{string_value}"""
     # Parse natural language query
@@ -183,25 +517,29 @@ async def filter_by_natural_language(query: str = Query(..., min_length=1)):
         raise HTTPException(status_code=400, detail="Unable to parse natural language query")
     
     # Apply filters
-    all_strings = list(strings_db.values())
-    filtered_strings = apply_filters(all_strings, filters)
+    filtered_strings = apply_filters(filters)
     
-    return {
-        "data": filtered_strings,
+    body = _dumps({
+        "data": [s.to_response_dict() for s in filtered_strings],
         "count": len(filtered_strings),
         "interpreted_query": {
             "original": query,
             "parsed_filters": filters
         }
-    }
+    })
+    return Response(content=body, media_type="application/json")
 
-@app.get("/strings", response_model=StringListResponse)
+@app.get(
+    "/strings",
+    responses={200: {"model": StringListResponse}}
+)
 async def get_all_strings(
     is_palindrome: Optional[bool] = Query(None),
     min_length: Optional[int] = Query(None, ge=0),
     max_length: Optional[int] = Query(None, ge=0),
     word_count: Optional[int] = Query(None, ge=0),
-    contains_character: Optional[str] = Query(None, min_length=1, max_length=1)
+    contains_character: Optional[str] = Query(None, min_length=1, max_length=1),
+    if_none_match: Optional[str] = Header(None)
 ):
     """Get all strings with optional filtering"""
     # Validate parameters
@@ -221,35 +559,47 @@ async def get_all_strings(
     if contains_character is not None:
         filters["contains_character"] = contains_character.lower()
     
-    # Apply filters
-    all_strings = list(strings_db.values())
-    filtered_strings = apply_filters(all_strings, filters)
+    # Serve unchanged results from the response cache
+    key = tuple(sorted(filters.items()))
+    cached = _response_cache.get(key)
+    if cached is None:
+        filtered_strings = apply_filters(filters)
+        body = _dumps({
+            "data": [s.to_response_dict() for s in filtered_strings],
+            "count": len(filtered_strings),
+            "filters_applied": filters
+        })
+        if len(_response_cache) >= _RESPONSE_CACHE_SIZE:
+            _response_cache.clear()
+        # Content-derived tag, so it differs per filter set and survives restarts
+        etag = f'"{_sha256(body).hexdigest()[:32]}"'
+        cached = _response_cache[key] = (etag, body)
     
-    return {
-        "data": filtered_strings,
-        "count": len(filtered_strings),
-        "filters_applied": filters
-    }
+    etag, body = cached
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @app.get("/strings/{string_value}", response_model=StringResponse)
 async def get_string(string_value: str = Path(...)):
     """Retrieve a specific string by its value"""
-    sha256_hash = compute_sha256(string_value)
+    digest = _hash_bytes(string_value)
     
-    if sha256_hash not in strings_db:
+    if digest not in strings_db:
         raise HTTPException(status_code=404, detail="String does not exist in the system")
     
-    return strings_db[sha256_hash]
+    return Response(content=strings_db[digest].body, media_type="application/json")
 
 @app.delete("/strings/{string_value}", status_code=204)
 async def delete_string(string_value: str = Path(...)):
     """Delete a string from the system"""
-    sha256_hash = compute_sha256(string_value)
+    digest = _hash_bytes(string_value)
     
-    if sha256_hash not in strings_db:
+    if digest not in strings_db:
         raise HTTPException(status_code=404, detail="String does not exist in the system")
     
-    del strings_db[sha256_hash]
+    _index_remove(digest, strings_db.pop(digest))
+    _invalidate_responses()
     return Response(status_code=204)
 
 if __name__ == "__main__":
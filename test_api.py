@@ -1,15 +1,17 @@
+from datetime import datetime
 from fastapi.testclient import TestClient
 from app import app
-from app import strings_db
+from app import clear_strings
+from app import _bulk_analyze, analyze_string
 
 import pytest
 
 
 @pytest.fixture(autouse=True)
 def clear_db_between_tests():
-    strings_db.clear()
+    clear_strings()
     yield
-    strings_db.clear()
+    clear_strings()
 
 client = TestClient(app)
 
@@ -27,6 +29,12 @@ def test_create_string():
     assert data["properties"]["word_count"] == 2
     assert data["properties"]["is_palindrome"] == False
 
+def test_created_at_format():
+    """Test created_at is an ISO 8601 UTC timestamp"""
+    response = client.post("/strings", json={"value": "timestamp me"})
+    created_at = response.json()["created_at"]
+    assert datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%S.%fZ")
+
 def test_create_palindrome():
     """Test creating a palindrome string"""
     response = client.post(
@@ -38,6 +46,16 @@ def test_create_palindrome():
     assert data["properties"]["is_palindrome"] == True
     assert data["properties"]["word_count"] == 1
 
+def test_create_mixed_case_palindrome():
+    """Test palindrome check ignores case and spaces"""
+    response = client.post(
+        "/strings",
+        json={"value": "Never odd or even"}
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["properties"]["is_palindrome"] == True
+
 def test_create_duplicate_string():
     """Test creating duplicate string returns 409"""
     # Create first string
@@ -72,6 +90,54 @@ def test_get_all_strings():
     assert "count" in data
     assert "filters_applied" in data
 
+def test_get_all_strings_etag():
+    """Test unchanged listings return 304 and mutations invalidate them"""
+    client.post("/strings", json={"value": "cached value"})
+    response = client.get("/strings")
+    etag = response.headers["etag"]
+    assert response.json()["count"] == 1
+    
+    response = client.get("/strings", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    
+    client.post("/strings", json={"value": "another value"})
+    response = client.get("/strings", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["count"] == 2
+
+def test_etag_differs_per_filter():
+    """Test an ETag from one filter set does not validate another"""
+    client.post("/strings", json={"value": "noon"})
+    client.post("/strings", json={"value": "hello"})
+    etag = client.get("/strings?is_palindrome=true").headers["etag"]
+    
+    response = client.get("/strings?is_palindrome=false", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [item["value"] for item in response.json()["data"]] == ["hello"]
+
+def test_etag_if_none_match_forms():
+    """Test If-None-Match lists, weak tags and * are honoured"""
+    client.post("/strings", json={"value": "noon"})
+    etag = client.get("/strings").headers["etag"]
+    
+    for header in [f'"other", {etag}', f"W/{etag}", "*"]:
+        response = client.get("/strings", headers={"If-None-Match": header})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+    
+    response = client.get("/strings", headers={"If-None-Match": '"other", W/"nope"'})
+    assert response.status_code == 200
+
+def test_get_all_strings_huge_filter():
+    """Test filter values beyond 64 bits do not break serialization"""
+    client.post("/strings", json={"value": "hello"})
+    response = client.get("/strings?min_length=99999999999999999999999")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 0
+    assert data["filters_applied"]["min_length"] == 99999999999999999999999
+
 def test_filter_by_palindrome():
     """Test filtering by palindrome"""
     # Create some test strings
@@ -118,6 +184,86 @@ def test_filter_by_contains_character():
     for item in data["data"]:
         assert "z" in item["value"].lower()
 
+def test_combined_filters():
+    """Test combining filters returns exactly the matching strings"""
+    for value in ["Anna", "level", "zebra", "a long racecar", "no match"]:
+        client.post("/strings", json={"value": value})
+    
+    response = client.get("/strings?is_palindrome=true&min_length=5&contains_character=e")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1
+    assert data["data"][0]["value"] == "level"
+    
+    response = client.get("/strings?word_count=1&max_length=4&contains_character=n")
+    data = response.json()
+    assert [item["value"] for item in data["data"]] == ["Anna"]
+
+def test_filtered_results_keep_insertion_order():
+    """Test filtered listings return rows in insertion order"""
+    values = ["level", "kayak", "hello", "racecar", "noon", "wow", "abc1", "A1 b2"]
+    for value in values:
+        client.post("/strings", json={"value": value})
+    
+    response = client.get("/strings?is_palindrome=true")
+    assert [item["value"] for item in response.json()["data"]] == ["level", "kayak", "racecar", "noon", "wow"]
+    
+    response = client.get("/strings?is_palindrome=false&contains_character=b")
+    assert [item["value"] for item in response.json()["data"]] == ["abc1", "A1 b2"]
+    
+    response = client.get("/strings?min_length=4&max_length=5")
+    assert [item["value"] for item in response.json()["data"]] == ["level", "kayak", "hello", "noon", "abc1", "A1 b2"]
+
+def test_filter_order_independent_of_seed_index():
+    """Test result order is stable when a different index becomes the smallest"""
+    for value in ["noon", "step on no pets", "kayak", "nurses run", "wow"]:
+        client.post("/strings", json={"value": value})
+    
+    # word_count=1 bucket (3) is smaller than the palindrome bucket (5)
+    response = client.get("/strings?is_palindrome=true&word_count=1")
+    assert [item["value"] for item in response.json()["data"]] == ["noon", "kayak", "wow"]
+    
+    # Now the palindrome bucket (6) is smaller than word_count=1 (9)
+    for value in ["apple", "banana", "cherry", "grape", "mango"]:
+        client.post("/strings", json={"value": value})
+    client.post("/strings", json={"value": "civic"})
+    response = client.get("/strings?is_palindrome=true&word_count=1")
+    assert [item["value"] for item in response.json()["data"]] == ["noon", "kayak", "wow", "civic"]
+
+def test_filters_after_delete():
+    """Test deleted strings no longer match filters"""
+    client.post("/strings", json={"value": "kayak"})
+    client.delete("/strings/kayak")
+    
+    response = client.get("/strings?is_palindrome=true")
+    assert response.status_code == 200
+    assert response.json()["count"] == 0
+
+def test_filter_by_digit_with_other_filter():
+    """Test a digit contains_character combined with another filter"""
+    for value in ["abc1", "a1 b2", "xyz", "1 2", "room101", "sky", "x1 y1 z1"]:
+        client.post("/strings", json={"value": value})
+    
+    # word_count=1 (4 rows) seeds the scan over "1" (5 rows); the digit is
+    # then checked against the bitmap
+    response = client.get("/strings?contains_character=1&word_count=1")
+    assert response.status_code == 200
+    assert [item["value"] for item in response.json()["data"]] == ["abc1", "room101"]
+    
+    response = client.get("/strings?contains_character=2&word_count=2")
+    assert [item["value"] for item in response.json()["data"]] == ["a1 b2", "1 2"]
+
+def test_filter_by_multi_codepoint_lowercase_character():
+    """Test contains_character whose lowercase form is several code points"""
+    client.post("/strings", json={"value": "xİy"})
+    client.post("/strings", json={"value": "plain"})
+    
+    response = client.get("/strings?contains_character=İ")
+    assert [item["value"] for item in response.json()["data"]] == ["xİy"]
+    
+    response = client.get("/strings?contains_character=İ&word_count=1")
+    assert [item["value"] for item in response.json()["data"]] == ["xİy"]
+
 def test_natural_language_single_word_palindrome():
     """Test natural language query for single word palindromes"""
     client.post("/strings", json={"value": "level"})
@@ -146,6 +292,32 @@ def test_natural_language_contains_letter():
     assert "contains_character" in data["interpreted_query"]["parsed_filters"]
     assert data["interpreted_query"]["parsed_filters"]["contains_character"] == "a"
 
+def test_natural_language_combined_filters():
+    """Test natural language query combining length and letter filters"""
+    response = client.get("/strings/filter-by-natural-language?query=strings shorter than 20 containing the letter z")
+    assert response.status_code == 200
+    data = response.json()
+    parsed = data["interpreted_query"]["parsed_filters"]
+    assert parsed["max_length"] == 19
+    assert parsed["contains_character"] == "z"
+
+def test_natural_language_overlapping_phrases():
+    """Test a length phrase right after the letter phrase is still parsed"""
+    response = client.get("/strings/filter-by-natural-language?query=strings that contain the letter longer than 5")
+    assert response.status_code == 200
+    parsed = response.json()["interpreted_query"]["parsed_filters"]
+    assert parsed["contains_character"] == "l"
+    assert parsed["min_length"] == 6
+
+def test_natural_language_huge_number():
+    """Test numbers beyond 64 bits in a query do not break serialization"""
+    client.post("/strings", json={"value": "hello"})
+    response = client.get("/strings/filter-by-natural-language?query=longer than 99999999999999999999999")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 0
+    assert data["interpreted_query"]["parsed_filters"]["min_length"] == 100000000000000000000000
+
 def test_delete_string():
     """Test deleting a string"""
     # Create string
@@ -159,6 +331,21 @@ def test_delete_string():
     response = client.get("/strings/delete me now")
     assert response.status_code == 404
 
+def test_get_all_strings_after_delete():
+    """Test listing reflects deletions from the middle of the store"""
+    for value in ["first one", "second one", "third one"]:
+        client.post("/strings", json={"value": value})
+    client.delete("/strings/first one")
+    
+    response = client.get("/strings")
+    data = response.json()
+    assert data["count"] == 2
+    assert [item["value"] for item in data["data"]] == ["second one", "third one"]
+    
+    client.delete("/strings/third one")
+    response = client.get("/strings")
+    assert [item["value"] for item in response.json()["data"]] == ["second one"]
+
 def test_delete_nonexistent_string():
     """Test deleting non-existent string returns 404"""
     response = client.delete("/strings/i really do not exist")
@@ -173,12 +360,31 @@ def test_character_frequency_map():
     assert freq_map["b"] == 2
     assert freq_map["c"] == 2
 
+def test_character_frequency_map_long_string():
+    """Test character frequency map for long ASCII strings"""
+    value = "ab c" * 500
+    response = client.post("/strings", json={"value": value})
+    data = response.json()
+    freq_map = data["properties"]["character_frequency_map"]
+    assert freq_map == {"a": 500, "b": 500, " ": 500, "c": 500}
+    assert list(freq_map) == ["a", "b", " ", "c"]
+    assert data["properties"]["unique_characters"] == 4
+
 def test_unique_characters():
     """Test unique characters count"""
     response = client.post("/strings", json={"value": "aabbcc"})
     data = response.json()
     assert data["properties"]["unique_characters"] == 3
 
+def test_bulk_analyze_matches_single():
+    """Test bulk analysis produces the same records as single analysis"""
+    values = ["racecar", "hello world", "", "naïve café", "ab c" * 200]
+    for bulk, value in zip(_bulk_analyze(values), values):
+        single = analyze_string(value)
+        assert bulk.id == single.id
+        assert bulk.properties == single.properties
+        assert list(bulk.properties.character_frequency_map) == list(single.properties.character_frequency_map)
+
 def test_invalid_value_type():
     """Test invalid value type returns 422"""
     response = client.post("/strings", json={"value": 123})